@@ -0,0 +1,32 @@
+"""Packaging for tge_volume.
+
+Set ``TGE_VOLUME_MYPYC=1`` (with ``mypy`` installed) to compile the
+synchronous ``markets`` and ``utils`` modules with mypyc. ``exchanges`` stays
+interpreted: mypyc does not support the async generators it uses. Without
+the flag, or when the compiled extensions are absent, the regular modules
+are used.
+"""
+import os
+from pathlib import Path
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("TGE_VOLUME_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "--ignore-missing-imports",
+            "tge_volume/markets.py",
+            "tge_volume/utils.py",
+        ]
+    )
+
+setup(
+    name="tge-volume",
+    version="1.0",
+    packages=["tge_volume"],
+    install_requires=Path(__file__).with_name("requirements.txt").read_text().split(),
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,94 @@
+"""Regression tests for the listing probe in ``tge_volume.exchanges``.
+
+The fake exchange serves 15m candles from a fixed listing time up to "now",
+optionally with missing candles (no trades), and models the three ways real
+exchanges treat a ``since`` that predates the listing.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any, Dict, List
+
+import pytest
+
+from tge_volume.exchanges import _MS_15M, _find_earliest_batch
+
+NOW = 1_700_000_000_000 // _MS_15M * _MS_15M
+LIMIT = 500
+
+
+class FakeExchange:
+    """Minimal async ``fetch_ohlcv`` over a synthetic 15m history.
+
+    ``mode`` controls requests whose ``since`` predates the listing:
+
+    * ``clamp``: the window is moved forward to start at the listing.
+    * ``window``: the plain ``[since, since + limit)`` window is returned.
+    * ``empty_before_listing``: nothing is returned at all.
+    """
+
+    def __init__(self, listing: int, mode: str, missing: float, seed: int) -> None:
+        self.listing = listing
+        self.mode = mode
+        rng = random.Random(seed)
+        # The listing candle itself always exists; later ones may be missing.
+        self.missing = {
+            ts
+            for ts in range(listing + _MS_15M, NOW, _MS_15M)
+            if rng.random() < missing
+        }
+
+    def milliseconds(self) -> int:
+        return NOW
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: int,
+        limit: int,
+        params: Dict[str, Any],
+    ) -> List[List[float]]:
+        start = -(-since // _MS_15M) * _MS_15M
+        if self.mode == "clamp":
+            start = max(start, self.listing)
+        elif self.mode == "empty_before_listing" and since < self.listing:
+            return []
+        end = min(start + limit * _MS_15M, NOW)
+        return [
+            [ts, 1.0, 1.0, 1.0, 1.0, 1.0]
+            for ts in range(start, end, _MS_15M)
+            if ts >= self.listing and ts not in self.missing
+        ]
+
+
+def _probe(exchange: FakeExchange) -> List[List[float]] | None:
+    return asyncio.run(
+        _find_earliest_batch(exchange, "ABC/USDT", "15m", _MS_15M, LIMIT, {})
+    )
+
+
+@pytest.mark.parametrize("mode", ["clamp", "window", "empty_before_listing"])
+@pytest.mark.parametrize("missing", [0.0, 0.01, 0.05, 0.3])
+@pytest.mark.parametrize("age", [501, 1_000, 19_575, 58_906, 80_000])
+def test_finds_listing_candle(mode: str, missing: float, age: int) -> None:
+    listing = NOW - age * _MS_15M
+    batch = _probe(FakeExchange(listing, mode, missing, seed=age))
+
+    assert batch
+    assert batch[0][0] == listing
+
+
+@pytest.mark.parametrize("mode", ["clamp", "window"])
+@pytest.mark.parametrize("age", [1, 3, 400])
+def test_finds_listing_candle_within_first_page(mode: str, age: int) -> None:
+    listing = NOW - age * _MS_15M
+    batch = _probe(FakeExchange(listing, mode, 0.05, seed=age))
+
+    assert batch
+    assert batch[0][0] == listing
+
+
+def test_returns_none_without_history() -> None:
+    assert _probe(FakeExchange(NOW, "window", 0.0, seed=0)) is None
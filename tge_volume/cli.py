@@ -1,18 +1,41 @@
 """Command line interface entrypoint for the TGE volume analysis tool."""
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import IO, Any, Callable, Dict, List
 
+import asyncio
+import contextlib
 import csv
+import math
+import os
+import shutil
 import sys
+import tempfile
 from argparse import ArgumentParser
+from pathlib import Path
 
 from tabulate import tabulate
 
 from .coingecko import get_coin_tickers, search_token
-from .exchanges import build_markets, fetch_exchange_stats, fetch_trading_flow
+from .exchanges import (
+    MAX_CONCURRENT_EXCHANGES,
+    exchanges_session,
+    fetch_all_exchange_stats,
+    iter_trading_flow,
+)
+from .markets import Market, build_markets
 from .utils import shorten_asset, ts_to_str
 
+# Stats placeholders for markets that could not be queried.
+_EMPTY_STATS: Dict[str, Any] = {
+    "tge_ts": None,
+    "tge_open": None,
+    "first_15m_volume": None,
+    "day_open": None,
+    "day_high": None,
+    "day_delta_ratio": None,
+}
+
 
 def choose_token(matches: List[Dict[str, Any]]) -> Dict[str, Any] | None:
     """Pick a single CoinGecko match when multiple results are returned."""
@@ -35,50 +58,64 @@ def choose_token(matches: List[Dict[str, Any]]) -> Dict[str, Any] | None:
         print("Invalid selection.")
 
 
-def _format_results(results: List[Dict[str, Any]]):
-    rows = []
-    total_volume = 0.0
-    weighted_delta_sum = 0.0
-    weighted_volume_sum = 0.0
+_TABLE_HEADERS = (
+    "EXCHANGE",
+    "CCXT ID",
+    "PAIR",
+    "TGE DATE",
+    "15m VOL (USDT)",
+    "DAY1 OPEN",
+    "DAY1 HIGH",
+    "HIGH/OPEN",
+    "NOTE/ERROR",
+)
+
+# Above this many rows tabulate's column sizing gets slow; emit plain TSV.
+_PLAIN_TABLE_THRESHOLD = 500
+
+_fmt2 = "{:.2f}".format
+_fmt6 = "{:.6f}".format
+_fmt2x = "{:.2f}x".format
 
-    for row in results:
-        volume = row["first_15m_volume"] or 0
-        total_volume += volume
 
-        if volume and row.get("day_delta_ratio"):
-            weighted_delta_sum += volume * row["day_delta_ratio"]
-            weighted_volume_sum += volume
+def _fmt(value: float | None, fmt: Callable[[float], str]) -> str:
+    """Format ``value`` with ``fmt``, rendering missing/zero values as ``-``."""
+    return fmt(value) if value else "-"
 
-        rows.append([
+
+def _format_results(results: List[Dict[str, Any]]):
+    rows = [
+        [
             row["exchange_name"],
             row.get("ccxt_id") or "-",
             f"{shorten_asset(row['base'])}/{shorten_asset(row['quote'])}",
             ts_to_str(row["tge_ts"]),
-            f"{row['first_15m_volume']:.2f}" if row["first_15m_volume"] else "-",
-            f"{row['day_open']:.6f}" if row["day_open"] else "-",
-            f"{row['day_high']:.6f}" if row["day_high"] else "-",
-            f"{row['day_delta_ratio']:.2f}x" if row["day_delta_ratio"] else "-",
+            _fmt(row["first_15m_volume"], _fmt2),
+            _fmt(row["day_open"], _fmt6),
+            _fmt(row["day_high"], _fmt6),
+            _fmt(row["day_delta_ratio"], _fmt2x),
             row["error"] or "",
-        ])
+        ]
+        for row in results
+    ]
 
-    print("\nDetails:\n")
-    print(
-        tabulate(
-            rows,
-            headers=[
-                "EXCHANGE",
-                "CCXT ID",
-                "PAIR",
-                "TGE DATE",
-                "15m VOL (USDT)",
-                "DAY1 OPEN",
-                "DAY1 HIGH",
-                "HIGH/OPEN",
-                "NOTE/ERROR",
-            ],
-            tablefmt="github",
+    total_volume = math.fsum(row["first_15m_volume"] or 0.0 for row in results)
+    weighted = [
+        (volume, delta)
+        for volume, delta in (
+            (row["first_15m_volume"], row.get("day_delta_ratio")) for row in results
         )
-    )
+        if volume and delta
+    ]
+    weighted_delta_sum = math.fsum(volume * delta for volume, delta in weighted)
+    weighted_volume_sum = math.fsum(volume for volume, _ in weighted)
+
+    print("\nDetails:\n")
+    if len(rows) > _PLAIN_TABLE_THRESHOLD:
+        print("\t".join(_TABLE_HEADERS))
+        print("\n".join("\t".join(map(str, row)) for row in rows))
+    else:
+        print(tabulate(rows, headers=_TABLE_HEADERS, tablefmt="github"))
 
     print("\nSUMMARY:")
     print("TOTAL:", f"{total_volume:.2f}")
@@ -91,185 +128,278 @@ def _format_results(results: List[Dict[str, Any]]):
     )
 
 
-def _export_trading_flow_csv(markets: List[Dict[str, Any]], path: str) -> None:
-    """Dump 15m OHLCV across all available exchanges for debugging."""
-
-    fieldnames = [
-        "exchange",
-        "symbol",
-        "timestamp_ms",
-        "timestamp",
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume_base",
-        "volume_quote",
-        "error",
+_CSV_FIELDNAMES = (
+    "exchange",
+    "symbol",
+    "timestamp_ms",
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume_base",
+    "volume_quote",
+    "error",
+)
+
+
+def _row_from_candle(candle: List[Any], exchange_name: str, symbol_pair: str) -> List[Any]:
+    """Return a CSV row (ordered as ``_CSV_FIELDNAMES``) for one candle."""
+    ts, open_, high, low, close, volume = candle
+    return [
+        exchange_name,
+        symbol_pair,
+        ts,
+        ts_to_str(ts),
+        open_,
+        high,
+        low,
+        close,
+        volume,
+        volume * close if volume and close else None,
+        None,
     ]
 
-    rows: List[Dict[str, Any]] = []
 
-    for market in markets:
+async def _export_trading_flow_csv(
+    markets: List[Market], path: str, semaphore: asyncio.Semaphore
+) -> None:
+    """Dump 15m OHLCV across all available exchanges for debugging.
+
+    Exchanges are downloaded concurrently (bounded by ``semaphore``), each
+    into its own temporary spool file; the spools are then appended in
+    market order so every exchange's rows stay together in the CSV.
+    """
+
+    rows_written = 0
+    error_rows = 0
+
+    # All writes happen on the event loop thread, so no locking is needed.
+    def write_error(writer: Any, market: Market, error: str) -> None:
+        nonlocal rows_written, error_rows
+        writer.writerow(
+            [market["exchange_name"], f"{market['base']}/{market['quote']}"]
+            + [None] * (len(_CSV_FIELDNAMES) - 3)
+            + [error]
+        )
+        rows_written += 1
+        error_rows += 1
+
+    async def export_market(market: Market, exchange_id: str, writer: Any) -> None:
+        nonlocal rows_written
         exchange_name = market["exchange_name"]
         symbol_pair = f"{market['base']}/{market['quote']}"
 
-        if not market["ccxt_id"]:
-            rows.append(
-                {
-                    "exchange": exchange_name,
-                    "symbol": symbol_pair,
-                    "timestamp_ms": None,
-                    "timestamp": None,
-                    "open": None,
-                    "high": None,
-                    "low": None,
-                    "close": None,
-                    "volume_base": None,
-                    "volume_quote": None,
-                    "error": market.get("disabled_reason")
-                    or "unsupported",
-                }
-            )
-            continue
-
-        try:
-            candles = fetch_trading_flow(
-                market["ccxt_id"], market["base"], market["quote"], timeframe="15m"
-            )
-            for candle in candles:
-                ts, open_, high, low, close, volume = candle
-                volume_quote = volume * close if volume and close else None
-                rows.append(
-                    {
-                        "exchange": exchange_name,
-                        "symbol": symbol_pair,
-                        "timestamp_ms": ts,
-                        "timestamp": ts_to_str(ts),
-                        "open": open_,
-                        "high": high,
-                        "low": low,
-                        "close": close,
-                        "volume_base": volume,
-                        "volume_quote": volume_quote,
-                        "error": None,
-                    }
+        async with semaphore:
+            try:
+                async for candles in iter_trading_flow(
+                    exchange_id, market["base"], market["quote"], timeframe="15m"
+                ):
+                    writer.writerows(
+                        [
+                            _row_from_candle(candle, exchange_name, symbol_pair)
+                            for candle in candles
+                        ]
+                    )
+                    rows_written += len(candles)
+            except Exception as exc:
+                write_error(writer, market, str(exc))
+
+    with open(path, "w", newline="") as fp, contextlib.ExitStack() as stack:
+        writer = csv.writer(fp)
+        writer.writerow(_CSV_FIELDNAMES)
+
+        spools: List[IO[str] | None] = []
+        tasks = []
+        for market in markets:
+            exchange_id = market["ccxt_id"]
+            if not exchange_id:
+                spools.append(None)
+                continue
+            spool = stack.enter_context(tempfile.TemporaryFile("w+", newline=""))
+            spools.append(spool)
+            tasks.append(export_market(market, exchange_id, csv.writer(spool)))
+
+        await asyncio.gather(*tasks)
+
+        for market, spooled in zip(markets, spools):
+            if spooled is None:
+                write_error(
+                    writer, market, market.get("disabled_reason") or "unsupported"
                 )
-        except Exception as exc:
-            rows.append(
-                {
-                    "exchange": exchange_name,
-                    "symbol": symbol_pair,
-                    "timestamp_ms": None,
-                    "timestamp": None,
-                    "open": None,
-                    "high": None,
-                    "low": None,
-                    "close": None,
-                    "volume_base": None,
-                    "volume_quote": None,
-                    "error": str(exc),
-                }
-            )
+            else:
+                spooled.seek(0)
+                shutil.copyfileobj(spooled, fp)
 
-    if not rows:
+    if not rows_written:
+        os.remove(path)
         print("\n[DEBUG] Could not collect trading flow — no data available.")
         return
 
-    with open(path, "w", newline="") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    rows_written = len(rows)
-    error_rows = len([r for r in rows if r["error"]])
     print(
         f"\n[DEBUG] 15m trading flow saved to {path} — "
         f"{rows_written} rows (errors: {error_rows})."
     )
 
 
-def main(argv: List[str] | None = None) -> None:
-    parser = ArgumentParser(description="TGE volume explorer")
-    parser.add_argument(
-        "symbol",
-        nargs="?",
-        help="Token ticker symbol (without $)",
-    )
-    parser.add_argument(
-        "--output-csv",
-        default="trading_flow_15m.csv",
-        help="Path to save the raw 15m trading flow CSV",
-    )
+def _empty_result(market: Market, error: str) -> Dict[str, Any]:
+    return {**market, **_EMPTY_STATS, "error": error}
 
-    args = parser.parse_args(argv)
 
-    symbol = args.symbol or input("Enter token ticker (without $): ").strip()
-    matches = search_token(symbol)
-    if not matches:
-        print("CoinGecko returned no matches.")
-        return
+async def _collect_results(
+    markets: List[Market], semaphore: asyncio.Semaphore
+) -> List[Dict[str, Any]]:
+    """Query every supported exchange concurrently and build report rows.
 
-    token = choose_token(matches)
-    if not token:
-        print("Token not selected.")
-        return
+    Markets without a ccxt id never reach the fan-out and get placeholder
+    rows; every row keeps its market's position in ``markets``.
+    """
 
-    coin_id = token["id"]
-    print(f"\nSelected token: {token['name']} ({token['symbol']})")
+    supported = [market for market in markets if market["ccxt_id"]]
+    total = len(supported)
+    done = 0
 
-    tickers, _ = get_coin_tickers(coin_id)
-    markets = build_markets(tickers)
+    def report_progress(market: Market) -> None:
+        nonlocal done
+        done += 1
+        print(f"[{done}/{total}] {market['exchange_name']}", end="\r")
 
-    print(f"\nExchanges found: {len(markets)}")
+    outcomes = await fetch_all_exchange_stats(
+        markets, on_done=report_progress, semaphore=semaphore
+    )
 
+    # Outcomes line up with ``supported``, which keeps the order of ``markets``.
+    supported_outcomes = iter(outcomes)
     results: List[Dict[str, Any]] = []
-    total = len(markets)
-    for idx, market in enumerate(markets, start=1):
-        progress = f"[{idx}/{total}] {market['exchange_name']}"
-        print(progress, end="\r")
+    for market in markets:
         if not market["ccxt_id"]:
             results.append(
-                {
-                    **market,
-                    "error": market.get("disabled_reason")
-                    or "unsupported",
-                    "tge_ts": None,
-                    "tge_open": None,
-                    "first_15m_volume": None,
-                    "day_open": None,
-                    "day_high": None,
-                    "day_delta_ratio": None,
-                }
+                _empty_result(market, market.get("disabled_reason") or "unsupported")
             )
             continue
+        outcome = next(supported_outcomes)
+        if isinstance(outcome, BaseException):
+            results.append(_empty_result(market, str(outcome)))
+            continue
+        results.append({**market, **outcome, "error": outcome.get("note")})
+    return results
 
-        try:
-            stats = fetch_exchange_stats(
-                market["ccxt_id"],
-                market["base"],
-                market["quote"],
-            )
-            results.append({**market, **stats, "error": stats.get("note")})
-        except Exception as exc:
-            results.append(
-                {
-                    **market,
-                    "error": str(exc),
-                    "tge_ts": None,
-                    "tge_open": None,
-                    "first_15m_volume": None,
-                    "day_open": None,
-                    "day_high": None,
-                    "day_delta_ratio": None,
-                }
-            )
+
+async def _run(
+    markets: List[Market],
+    output_csv: str,
+    semaphore: asyncio.Semaphore,
+    label: str | None = None,
+) -> None:
+    results = await _collect_results(markets, semaphore)
     print(" " * 40, end="\r")
     print()
+    if label:
+        print(f"===== {label} =====")
     _format_results(results)
 
     # Dump raw 15m trading flow for debugging incorrect TGE selection.
-    _export_trading_flow_csv(markets, args.output_csv)
+    await _export_trading_flow_csv(markets, output_csv, semaphore)
+
+
+async def _run_single(markets: List[Market], output_csv: str) -> None:
+    async with exchanges_session():
+        await _run(markets, output_csv, asyncio.Semaphore(MAX_CONCURRENT_EXCHANGES))
+
+
+def _resolve_markets(symbol: str, *, interactive: bool = True) -> List[Market] | None:
+    """Look the ticker up on CoinGecko and return its exchange markets.
+
+    Without ``interactive`` the top CoinGecko match is used instead of
+    prompting, so batch runs never block on ``input()``.
+    """
+    matches = search_token(symbol)
+    if not matches:
+        print(f"CoinGecko returned no matches for {symbol}.")
+        return None
+
+    token = choose_token(matches) if interactive else matches[0]
+    if not token:
+        print("Token not selected.")
+        return None
+
+    coin_id = token["id"]
+    print(f"\nSelected token: {token['name']} ({token['symbol']})")
+
+    tickers, _ = get_coin_tickers(coin_id)
+    markets = build_markets(tickers)
+
+    print(f"\nExchanges found for {symbol}: {len(markets)}")
+    return markets
+
+
+def _symbol_output_path(path: str, symbol: str) -> str:
+    """Return ``path`` with the ticker appended to the file name."""
+    target = Path(path)
+    return str(target.with_name(f"{target.stem}_{symbol.upper()}{target.suffix}"))
+
+
+async def _run_batch(symbols: List[str], output_csv: str) -> None:
+    """Analyze several tickers concurrently, one CSV per ticker.
+
+    All tickers share one semaphore, so at most ``MAX_CONCURRENT_EXCHANGES``
+    exchange lookups run at once across the whole batch.
+    """
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXCHANGES)
+
+    async def one_symbol(symbol: str) -> None:
+        markets = await asyncio.to_thread(_resolve_markets, symbol, interactive=False)
+        if markets is None:
+            return
+        await _run(
+            markets, _symbol_output_path(output_csv, symbol), semaphore, label=symbol
+        )
+
+    async with exchanges_session():
+        outcomes = await asyncio.gather(
+            *(one_symbol(symbol) for symbol in symbols), return_exceptions=True
+        )
+    for symbol, outcome in zip(symbols, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"\n{symbol}: failed — {outcome}")
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = ArgumentParser(description="TGE volume explorer")
+    parser.add_argument(
+        "symbols",
+        nargs="*",
+        metavar="symbol",
+        help=(
+            "Token ticker symbol(s) (without $). Tickers given here use the top "
+            "CoinGecko match without prompting; several are analyzed concurrently"
+        ),
+    )
+    parser.add_argument(
+        "--output-csv",
+        default="trading_flow_15m.csv",
+        help=(
+            "Path to save the raw 15m trading flow CSV; with several tickers "
+            "the ticker is appended to the file name"
+        ),
+    )
+
+    args = parser.parse_args(argv)
+
+    # Preserve order while dropping repeated tickers; tickers are
+    # case-insensitive and output files use the upper-cased form.
+    symbols = list(dict.fromkeys(symbol.upper() for symbol in args.symbols))
+    if len(symbols) > 1:
+        asyncio.run(_run_batch(symbols, args.output_csv))
+        return
+
+    symbol = symbols[0] if symbols else input("Enter token ticker (without $): ").strip()
+    markets = _resolve_markets(symbol, interactive=not symbols)
+    if markets is None:
+        return
+
+    asyncio.run(_run_single(markets, args.output_csv))
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,25 +1,75 @@
 """Minimal wrapper around the CoinGecko REST API."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import calendar
+from datetime import datetime
 from typing import Any, Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .utils import cache_path, json_loads, read_json_cache, write_json_cache
 
 COINGECKO_API = "https://api.coingecko.com/api/v3"
 
+# Seconds to reuse cached responses; coin details change faster than search hits.
+SEARCH_CACHE_TTL = 10 * 60
+COIN_CACHE_TTL = 2 * 60
+
+# (connect, read) timeouts in seconds for CoinGecko requests.
+REQUEST_TIMEOUT = (3.05, 10)
+
+# One keep-alive session so consecutive calls reuse the TCP/TLS connection.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "tge-volume/1.0"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        # CoinGecko's free tier answers 429 quickly; back off (honouring
+        # Retry-After) rather than aborting the whole run.
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 def search_token(symbol: str) -> List[Dict[str, Any]]:
     """Return CoinGecko projects matching the given ticker symbol."""
-    response = requests.get(f"{COINGECKO_API}/search", params={"query": symbol})
-    response.raise_for_status()
-    data = response.json()
-    return [c for c in data["coins"] if c.get("symbol", "").lower() == symbol.lower()]
+    path = cache_path("coingecko/search", symbol.lower())
+    data = read_json_cache(path, SEARCH_CACHE_TTL)
+    if data is None:
+        response = _SESSION.get(
+            f"{COINGECKO_API}/search",
+            params={"query": symbol},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+        write_json_cache(path, data)
+    wanted = symbol.lower()
+    return [c for c in data["coins"] if (c.get("symbol") or "").lower() == wanted]
 
 
 def get_coin_tickers(coin_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    """Fetch tickers for a project and return the raw CoinGecko payload."""
-    response = requests.get(
+    """Fetch tickers for a project plus the coin fields the CLI relies on.
+
+    Only ``genesis_date`` and ``tickers`` are kept from the payload; large
+    sections such as ``description`` or ``links`` are dropped right away.
+    """
+    path = cache_path("coingecko/coins", coin_id)
+    data = read_json_cache(path, COIN_CACHE_TTL)
+    if data is not None:
+        return data["tickers"], data
+
+    response = _SESSION.get(
         f"{COINGECKO_API}/coins/{coin_id}",
         params={
             "localization": "false",
@@ -29,10 +79,49 @@ def get_coin_tickers(coin_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]
             "developer_data": "false",
             "sparkline": "false",
         },
+        timeout=REQUEST_TIMEOUT,
     )
     response.raise_for_status()
-    data = response.json()
-    return data["tickers"], data
+    data = json_loads(response.content)
+    slim = {
+        "genesis_date": data.get("genesis_date"),
+        "tickers": data.get("tickers", []),
+    }
+    write_json_cache(path, slim)
+    return slim["tickers"], slim
+
+
+def _iso_to_ms(value: str, *, with_time: bool) -> int:
+    """Convert ``YYYY-MM-DD[THH:MM:SS[.fff][Z|+00:00]]`` (UTC) into milliseconds.
+
+    Slicing the fixed-width fields avoids strptime's locale-aware parsing,
+    which dominates when scanning thousands of tickers. Anything else,
+    including impossible dates such as ``2021-02-30``, raises ``ValueError``.
+    """
+    if with_time:
+        # Fractional seconds are dropped, matching the whole-second candles.
+        suffix = value[19:]
+        if suffix[:1] == ".":
+            suffix = suffix[1:].lstrip("0123456789")
+        well_formed = (
+            value[4:5] == value[7:8] == "-"
+            and value[10:11] == "T"
+            and value[13:14] == value[16:17] == ":"
+            and suffix in ("", "Z", "+00:00")
+        )
+    else:
+        well_formed = len(value) == 10 and value[4:5] == value[7:8] == "-"
+    if not well_formed:
+        raise ValueError(f"Unsupported timestamp: {value!r}")
+
+    fields = (int(value[0:4]), int(value[5:7]), int(value[8:10])) + (
+        (int(value[11:13]), int(value[14:16]), int(value[17:19]))
+        if with_time
+        else (0, 0, 0)
+    )
+    # timegm happily normalizes out-of-range fields; datetime rejects them.
+    datetime(*fields)
+    return calendar.timegm(fields) * 1000
 
 
 def get_expected_tge_ts(coin_data: Dict[str, Any]) -> int | None:
@@ -40,19 +129,20 @@ def get_expected_tge_ts(coin_data: Dict[str, Any]) -> int | None:
     genesis = coin_data.get("genesis_date")
     if genesis:
         try:
-            dt = datetime.strptime(genesis, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            return int(dt.timestamp() * 1000)
+            return _iso_to_ms(genesis, with_time=False)
         except ValueError:
             pass
 
-    timestamps: List[int] = []
+    earliest: int | None = None
     for ticker in coin_data.get("tickers", []):
         ts = ticker.get("last_traded_at")
         if not ts:
             continue
         try:
-            timestamps.append(int(datetime.fromisoformat(ts.replace("Z", "")).timestamp() * 1000))
+            ts_ms = _iso_to_ms(ts, with_time=True)
         except ValueError:
             continue
+        if earliest is None or ts_ms < earliest:
+            earliest = ts_ms
 
-    return min(timestamps) if timestamps else None
+    return earliest
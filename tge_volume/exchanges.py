@@ -1,34 +1,26 @@
-"""Helpers for building a ccxt-compatible market list and fetching OHLCV data."""
+"""Helpers for fetching OHLCV data for exchange markets through async ccxt.
+
+The public fetch helpers share one ccxt instance per exchange on the running
+event loop; use them inside ``async with exchanges_session():`` so those
+instances are closed before the loop ends.
+"""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
-
-import ccxt
-
-from .utils import is_dex_name
-
-EXCHANGE_NAME_TO_CCXT_ID = {
-    "Binance": "binance",
-    "Binance US": "binanceus",
-    "OKX": "okx",
-    "OKX (Spot)": "okx",
-    "Bybit": "bybit",
-    "KuCoin": "kucoin",
-    "Gate": "gateio",
-    "Gate.io": "gateio",
-    "Gate (Spot)": "gateio",
-    "MEXC": "mexc",
-    "BitMart": "bitmart",
-    "Bitget": "bitget",
-    "Coinbase Exchange": "coinbase",
-    "Kraken": "kraken",
-    "Uniswap V2": "uniswap",
-    "Uniswap V3 (Ethereum)": "uniswap",
-    "PancakeSwap (v2)": "pancakeswap",
-    "BitMart": "bitmart",
-    "BingX": "bingx",
-    "LBank": "lbank",
-}
+import asyncio
+import math
+import os
+import ssl
+import time
+from bisect import bisect_right
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+import aiohttp
+import certifi
+import ccxt.async_support as ccxt
+
+from .markets import Market
+from .utils import cache_path, read_json_cache, write_json_cache
 
 # Some exchanges require special setup to ensure we talk to the spot API.
 EXCHANGE_SETUP_OVERRIDES: Dict[str, Dict[str, Any]] = {
@@ -44,125 +36,282 @@ EXCHANGE_FETCH_OHLCV_PARAMS: Dict[str, Dict[str, Any]] = {
     "bitmart": {"type": "spot"},
 }
 
-# Allow selectively disabling exchanges (e.g., for temporary outages) while
-# still showing them in the CLI output.
-DISABLED_EXCHANGES: Dict[str, str] = {}
+# Candle durations in milliseconds, so the hot paths skip ccxt's parser.
+_MS_15M = 15 * 60 * 1000
+_MS_1D = 24 * 60 * 60 * 1000
+
+# Upper bound on exchanges queried at the same time. Each instance keeps
+# ccxt's own rate limiter enabled; this only caps cross-exchange fan-out.
+MAX_CONCURRENT_EXCHANGES = 8
+
+# Exchange instances shared per event loop (async ccxt instances are bound to
+# the loop they were first used on). See _get_exchange/close_exchanges.
+_EXCHANGES: Dict[asyncio.AbstractEventLoop, Dict[str, ccxt.Exchange]] = {}
+
+# One aiohttp session per event loop handed to every exchange instance, so
+# all of them draw from a single bounded keep-alive pool instead of each
+# creating its own connector. ccxt leaves sessions it did not create open;
+# close_exchanges closes this one.
+_SESSIONS: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+# Opt-in on-disk copy of the market catalogues (``TGE_MARKETS_CACHE=1``).
+# Entries expire at midnight UTC so newly listed pairs show up the next day.
+MARKETS_DISK_CACHE = os.environ.get("TGE_MARKETS_CACHE") == "1"
+
+# Opt-in on-disk copy of finished launch stats (``TGE_STATS_CACHE=1``). They
+# never expire, so entries carry a version that is bumped whenever the way
+# stats are computed changes; older entries are then ignored and refetched.
+STATS_DISK_CACHE = os.environ.get("TGE_STATS_CACHE") == "1"
+_STATS_CACHE_VERSION = 1
+_STATS_KEYS = (
+    "tge_ts",
+    "tge_open",
+    "first_15m_volume",
+    "day_open",
+    "day_high",
+    "day_delta_ratio",
+    "note",
+)
+
+
+def _create_exchange(exchange_id: str) -> ccxt.Exchange:
+    """Instantiate an async ccxt exchange; the caller must close it."""
 
-def build_markets(tickers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Return a deduplicated list of markets with volume metadata."""
-    markets: Dict[str, Dict[str, Any]] = {}
+    exchange_class = getattr(ccxt, exchange_id)
+    exchange_kwargs = EXCHANGE_SETUP_OVERRIDES.get(exchange_id, {})
+    return exchange_class({**exchange_kwargs, "session": _get_session()})
 
-    for ticker in tickers:
-        name = ticker.get("market", {}).get("name")
-        if not name:
-            continue
 
-        if is_dex_name(name):
-            # The CLI focuses on centralized exchanges only, so skip DEX entries
-            continue
+def _get_session() -> aiohttp.ClientSession:
+    """Return the HTTP session shared by exchange instances on this event loop."""
 
-        base = ticker.get("base")
-        quote = ticker.get("target")
-        if not base or not quote:
-            continue
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    if session is None:
+        connector = aiohttp.TCPConnector(
+            # Same CA bundle ccxt uses for the sessions it creates itself.
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit=64,
+            limit_per_host=10,
+            keepalive_timeout=60,
+        )
+        session = _SESSIONS[loop] = aiohttp.ClientSession(connector=connector)
+    return session
 
-        volume = ticker.get("volume") or 0
-        if name not in markets or volume > markets[name]["volume"]:
-            disabled_reason = DISABLED_EXCHANGES.get(name)
-            markets[name] = {
-                "exchange_name": name,
-                "base": base,
-                "quote": quote,
-                "volume": volume,
-                "ccxt_id": None if disabled_reason else EXCHANGE_NAME_TO_CCXT_ID.get(name),
-                "disabled_reason": disabled_reason,
-            }
 
-    return list(markets.values())
+def _get_exchange(exchange_id: str) -> ccxt.Exchange:
+    """Return the shared exchange instance for ``exchange_id`` on this event loop.
 
+    Reusing one instance keeps its HTTP session (and TLS connections), rate
+    limiter and loaded markets warm across symbols and across the stats and
+    trading-flow passes.
+    """
 
+    exchanges = _EXCHANGES.setdefault(asyncio.get_running_loop(), {})
+    exchange = exchanges.get(exchange_id)
+    if exchange is None:
+        exchange = exchanges[exchange_id] = _create_exchange(exchange_id)
+    return exchange
 
-def _prepare_exchange_market(
-    exchange_id: str, base: str, quote: str, timeframe: str = "15m"
-) -> Tuple[ccxt.Exchange, str, int, int, Dict[str, Any]]:
-    """Return an initialized exchange, symbol and OHLCV fetch config."""
 
-    exchange_class = getattr(ccxt, exchange_id)
-    exchange_kwargs = EXCHANGE_SETUP_OVERRIDES.get(exchange_id, {})
-    exchange = exchange_class(exchange_kwargs)
-    exchange.load_markets()
+async def close_exchanges() -> None:
+    """Close every exchange instance and the HTTP session shared on the running loop.
+
+    Call this before the loop finishes (e.g., at the end of the coroutine
+    passed to ``asyncio.run``); async ccxt instances cannot outlive it.
+    """
+
+    loop = asyncio.get_running_loop()
+    exchanges = _EXCHANGES.pop(loop, {})
+    await asyncio.gather(
+        *(exchange.close() for exchange in exchanges.values()),
+        return_exceptions=True,
+    )
+    session = _SESSIONS.pop(loop, None)
+    if session is not None:
+        await session.close()
+
+
+@asynccontextmanager
+async def exchanges_session() -> AsyncIterator[None]:
+    """Close the exchange instances shared on this loop when the block exits.
+
+    The public fetch helpers reuse one ccxt instance per exchange instead of
+    closing it after each call; wrap their use in ``async with
+    exchanges_session():`` so nothing outlives the event loop.
+    """
+
+    try:
+        yield
+    finally:
+        await close_exchanges()
+
+
+async def _load_markets(exchange: ccxt.Exchange, exchange_id: str) -> None:
+    """Populate ``exchange.markets``, downloading them once per run (or day)."""
+
+    if exchange.markets:
+        return
+
+    path = cache_path("markets", exchange_id)
+    if MARKETS_DISK_CACHE:
+        seconds_since_midnight = time.time() % 86400
+        payload = read_json_cache(path, seconds_since_midnight)
+        if payload:
+            exchange.set_markets(payload["markets"], payload["currencies"])
+            return
+
+    await exchange.load_markets()
+    if MARKETS_DISK_CACHE:
+        write_json_cache(
+            path, {"markets": exchange.markets, "currencies": exchange.currencies}
+        )
+
 
-    normalized_base = base.upper()
-    normalized_quote = quote.upper()
+def _market_index(exchange: ccxt.Exchange) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    """Return markets grouped by upper-cased ``(base, quote)``, built once per instance."""
 
-    def _matching_markets(prefer_spot: bool) -> List[Dict[str, Any]]:
-        matches: List[Dict[str, Any]] = []
+    index = getattr(exchange, "_tge_index", None)
+    if index is None:
+        index = {}
         for market in exchange.markets.values():
             market_base = market.get("base")
             market_quote = market.get("quote")
             if not market_base or not market_quote:
                 continue
-            if market_base.upper() == normalized_base and market_quote.upper() == normalized_quote:
-                if not prefer_spot or market.get("spot"):
-                    matches.append(market)
-        return matches
+            index.setdefault((market_base.upper(), market_quote.upper()), []).append(market)
+        exchange._tge_index = index
+    return index
 
-    spot_matches = _matching_markets(prefer_spot=True)
-    derivative_matches = _matching_markets(prefer_spot=False)
 
-    market = None
-    if spot_matches:
-        market = spot_matches[0]
-    elif derivative_matches:
-        market = derivative_matches[0]
+async def _prepare_exchange_market(
+    exchange: ccxt.Exchange,
+    exchange_id: str,
+    base: str,
+    quote: str,
+    timeframe: str = "15m",
+) -> Tuple[str, int, int, Dict[str, Any]]:
+    """Return the symbol and OHLCV fetch config for the pair on ``exchange``."""
+
+    await _load_markets(exchange, exchange_id)
+
+    candidates = _market_index(exchange).get((base.upper(), quote.upper()), [])
+    # Prefer the first spot listing; fall back to any market type.
+    market = next((candidate for candidate in candidates if candidate.get("spot")), None)
+    if market is None and candidates:
+        market = candidates[0]
 
     if not market:
         raise RuntimeError(f"Pair {base}/{quote} was not found on {exchange_id}")
 
     symbol = market["symbol"]
-    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    if timeframe == "15m":
+        timeframe_ms = _MS_15M
+    else:
+        timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
     limit = exchange.options.get("OHLCVLimit") or 500
     fetch_params = EXCHANGE_FETCH_OHLCV_PARAMS.get(exchange_id, {})
 
-    return exchange, symbol, timeframe_ms, limit, fetch_params
+    return symbol, timeframe_ms, limit, fetch_params
 
 
-def _collect_full_ohlcv(
+async def _find_earliest_batch(
     exchange: ccxt.Exchange,
     symbol: str,
     timeframe: str,
     timeframe_ms: int,
     limit: int,
     fetch_params: Dict[str, Any],
-) -> List[List[float]]:
-    """Fetch the full available OHLCV history for the given symbol."""
-
-    earliest_batch: List[List[float]] | None = None
-    probe_since = exchange.milliseconds() - timeframe_ms * limit
-    while True:
-        candles = exchange.fetch_ohlcv(
+) -> List[List[Any]] | None:
+    """Return the batch of candles that starts at the oldest available one.
+
+    The probe doubles its distance from now on every step until the
+    exchange stops returning older data. If it hit an empty window, it then
+    binary-searches between that window and the last one that had data.
+    Deep histories cost O(log n) requests instead of one request per
+    ``limit`` candles.
+    """
+
+    async def fetch(since: int) -> List[List[Any]]:
+        return await exchange.fetch_ohlcv(
             symbol,
             timeframe=timeframe,
-            since=probe_since,
+            since=since,
             limit=limit,
             params=fetch_params,
         )
+
+    # Keep every probe on a candle boundary so the search converges on an
+    # actual candle open time.
+    now = exchange.milliseconds() // timeframe_ms * timeframe_ms
+    step = timeframe_ms * limit
+    earliest_batch: List[List[Any]] | None = None
+    earliest_since = now
+    while True:
+        probe_since = max(now - step, 0)
+        candles = await fetch(probe_since)
         if not candles:
             break
-        if earliest_batch is not None and candles[0][0] == earliest_batch[0][0]:
-            break
+        if earliest_batch is not None and candles[0][0] >= earliest_batch[0][0]:
+            # The exchange clamps ``since`` to the listing: nothing older.
+            return earliest_batch
         earliest_batch = candles
-        probe_since -= timeframe_ms * limit
+        earliest_since = probe_since
+        if probe_since == 0:
+            return earliest_batch
+        step *= 2
+
+    if earliest_batch is None:
+        return None
+
+    # The listing lies between the empty probe and the last one with data.
+    # Each step probes a full ``limit`` window, so runs of missing candles
+    # (no trades) shorter than one page are not mistaken for "not listed yet".
+    low, high = probe_since, earliest_since
+    while high - low > timeframe_ms:
+        mid = low + (high - low) // timeframe_ms // 2 * timeframe_ms
+        candles = await fetch(mid)
+        if candles:
+            high = mid
+            earliest_batch = candles
+        else:
+            low = mid
+
+    return earliest_batch
+
+
+async def _find_earliest_candle(
+    exchange: ccxt.Exchange,
+    symbol: str,
+    timeframe: str,
+    timeframe_ms: int,
+    limit: int,
+    fetch_params: Dict[str, Any],
+) -> List[Any] | None:
+    """Return the oldest available candle without paging through the history."""
+
+    earliest_batch = await _find_earliest_batch(
+        exchange, symbol, timeframe, timeframe_ms, limit, fetch_params
+    )
+    return earliest_batch[0] if earliest_batch else None
 
-    if not earliest_batch:
-        return []
 
-    all_candles: List[List[float]] = []
-    next_since = earliest_batch[0][0]
+async def _iter_ohlcv_pages(
+    exchange: ccxt.Exchange,
+    symbol: str,
+    timeframe: str,
+    timeframe_ms: int,
+    limit: int,
+    fetch_params: Dict[str, Any],
+    since: int,
+) -> AsyncIterator[List[List[Any]]]:
+    """Yield raw OHLCV pages from ``since`` forward until history runs out."""
+
+    next_since = since
     last_first_ts = None
 
     while True:
-        candles = exchange.fetch_ohlcv(
+        candles = await exchange.fetch_ohlcv(
             symbol,
             timeframe=timeframe,
             since=next_since,
@@ -175,50 +324,118 @@ def _collect_full_ohlcv(
             break
 
         last_first_ts = candles[0][0]
-        all_candles.extend(candles)
+        yield candles
         next_since = candles[-1][0] + timeframe_ms
 
         if len(candles) < limit:
             break
 
-    dedup = {candle[0]: candle for candle in all_candles}
-    return [dedup[ts] for ts in sorted(dedup)]
 
+async def _fetch_day_candles(
+    exchange: ccxt.Exchange,
+    symbol: str,
+    target_ts: int,
+    fetch_params: Dict[str, Any],
+) -> List[List[Any]]:
+    """Fetch the daily candles around ``target_ts``."""
+
+    # Request a window that surely covers the target TGE day.  Some
+    # exchanges round the `since` argument down to daily boundaries and
+    # return the *previous* day when `since` is close to midnight.  By
+    # asking for a slightly earlier window (two days back) and then
+    # picking the candle that actually contains the target timestamp we
+    # avoid mismatches (e.g., reporting the day before/after TGE).
+    return await exchange.fetch_ohlcv(
+        symbol,
+        timeframe="1d",
+        since=target_ts - _MS_1D * 2,
+        limit=10,
+        params=fetch_params,
+    )
 
-def fetch_exchange_stats(
+
+async def fetch_exchange_stats(
     exchange_id: str,
     base: str,
     quote: str,
     expected_tge_ts: int | None = None,
 ) -> Dict[str, Any]:
-    """Fetch the earliest available OHLCV candle for the pair."""
+    """Fetch the earliest available OHLCV candle for the pair.
+
+    Finished launches are served from the on-disk stats cache when present.
+    """
+
+    path = cache_path("stats", f"{exchange_id}:{base}:{quote}".lower())
+    if STATS_DISK_CACHE:
+        entry = read_json_cache(path, math.inf)
+        if entry and _cached_stats_match(entry, expected_tge_ts):
+            return entry["stats"]
+
+    stats = await _fetch_exchange_stats(
+        _get_exchange(exchange_id), exchange_id, base, quote, expected_tge_ts
+    )
+    if STATS_DISK_CACHE and _stats_are_final(stats):
+        write_json_cache(
+            path,
+            {
+                "version": _STATS_CACHE_VERSION,
+                "expected_tge_ts": expected_tge_ts,
+                "stats": stats,
+            },
+        )
+    return stats
 
+
+def _cached_stats_match(entry: Dict[str, Any], expected_tge_ts: int | None) -> bool:
+    """Return whether a cached stats entry answers a lookup for ``expected_tge_ts``.
+
+    Outdated or malformed entries never match, so they are simply refetched.
+    """
+    try:
+        if entry["version"] != _STATS_CACHE_VERSION:
+            return False
+        stats = entry["stats"]
+        if not all(key in stats for key in _STATS_KEYS):
+            return False
+        if stats["note"] is None:
+            # Full stats stay valid unless the caller now expects an earlier launch.
+            return not expected_tge_ts or stats["tge_ts"] <= expected_tge_ts
+        return entry["expected_tge_ts"] == expected_tge_ts
+    except (KeyError, TypeError):
+        return False
+
+
+def _stats_are_final(stats: Dict[str, Any]) -> bool:
+    """Return whether ``stats`` can no longer change on later runs."""
+    if time.time() * 1000 - stats["tge_ts"] <= 2 * _MS_1D:
+        # The launch day candle may still be open.
+        return False
+    # A missing day candle is most likely a failed request; retry next run.
+    return stats["note"] is not None or stats["day_open"] is not None
+
+
+async def _fetch_exchange_stats(
+    exchange: ccxt.Exchange,
+    exchange_id: str,
+    base: str,
+    quote: str,
+    expected_tge_ts: int | None,
+) -> Dict[str, Any]:
     (
-        exchange,
         symbol,
         timeframe_ms,
         limit,
         fetch_params,
-    ) = _prepare_exchange_market(exchange_id, base, quote)
+    ) = await _prepare_exchange_market(exchange, exchange_id, base, quote)
     timeframe = "15m"
 
     try:
-        candles = _collect_full_ohlcv(
-            exchange,
-            symbol,
-            timeframe,
-            timeframe_ms,
-            limit,
-            fetch_params,
+        target_candle = await _find_earliest_candle(
+            exchange, symbol, timeframe, timeframe_ms, limit, fetch_params
         )
-
-        if not candles:
+        if not target_candle:
             raise RuntimeError("Exchange returned no OHLCV data")
 
-        target_candle = candles[0]
-
-        target_candle = candles[0]
-
         (
             oldest_ts,
             oldest_open,
@@ -254,40 +471,16 @@ def fetch_exchange_stats(
             "note": "Exchange history starts after TGE — launch candle unavailable",
         }
 
+    day_open = day_high = day_delta = None
     try:
-        day_timeframe_ms = exchange.parse_timeframe("1d") * 1000
-        target_ts = oldest_ts
-        # Request a window that surely covers the target TGE day.  Some
-        # exchanges round the `since` argument down to daily boundaries and
-        # return the *previous* day when `since` is close to midnight.  By
-        # asking for a slightly earlier window (two days back) and then
-        # picking the candle that actually contains the target timestamp we
-        # avoid mismatches (e.g., reporting the day before/after TGE).
-        day_since_ts = (target_ts or oldest_ts) - day_timeframe_ms * 2
-        day = exchange.fetch_ohlcv(
-            symbol,
-            timeframe="1d",
-            since=day_since_ts,
-            limit=10,
-            params=fetch_params,
-        )
-
-        day_open = day_high = day_delta = None
+        day = await _fetch_day_candles(exchange, symbol, oldest_ts, fetch_params)
         if day:
-            day_candle = None
-            for candle in day:
-                start = candle[0]
-                if start <= target_ts < start + day_timeframe_ms:
-                    day_candle = candle
-                    break
-
-            if not day_candle:
-                # Fallback to the latest candle before the target timestamp,
-                # or the first candle if the exchange returned only newer
-                # data.  This mirrors the old behaviour but only when we fail
-                # to confidently identify the TGE day.
-                eligible = [c for c in day if c[0] <= target_ts]
-                day_candle = max(eligible, key=lambda c: c[0], default=day[0])
+            # ccxt returns candles sorted by open time, so the latest one
+            # opening at or before the launch is the day containing it (or,
+            # with gaps, the closest earlier day).  Fall back to the first
+            # candle if the exchange returned only newer data.
+            idx = bisect_right([candle[0] for candle in day], oldest_ts) - 1
+            day_candle = day[idx] if idx >= 0 else day[0]
 
             day_open = day_candle[1]
             day_high = day_candle[2]
@@ -308,28 +501,101 @@ def fetch_exchange_stats(
     }
 
 
-def fetch_trading_flow(
+async def fetch_all_exchange_stats(
+    markets: List[Market],
+    expected_tge_ts: int | None = None,
+    on_done: Callable[[Market], None] | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> List[Dict[str, Any] | BaseException]:
+    """Run :func:`fetch_exchange_stats` for every supported market concurrently.
+
+    Markets without a ``ccxt_id`` are skipped, so the result lines up with
+    ``[m for m in markets if m["ccxt_id"]]``. Failures are returned in place
+    of the stats dict instead of being raised. ``on_done`` is called with
+    each market as soon as its lookup finishes. Pass ``semaphore`` to share
+    one concurrency bound across several calls; by default each call allows
+    ``MAX_CONCURRENT_EXCHANGES`` lookups at once.
+    """
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXCHANGES)
+
+    async def _guarded(market: Market, exchange_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await fetch_exchange_stats(
+                    exchange_id,
+                    market["base"],
+                    market["quote"],
+                    expected_tge_ts,
+                )
+            finally:
+                if on_done is not None:
+                    on_done(market)
+
+    tasks = [
+        _guarded(market, exchange_id)
+        for market in markets
+        if (exchange_id := market["ccxt_id"])
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_trading_flow(
     exchange_id: str, base: str, quote: str, timeframe: str = "15m"
-) -> List[List[float]]:
+) -> List[List[Any]]:
     """Return the full 15m trading flow for debugging purposes."""
 
+    return [
+        candle
+        async for candles in iter_trading_flow(exchange_id, base, quote, timeframe)
+        for candle in candles
+    ]
+
+
+async def iter_trading_flow(
+    exchange_id: str, base: str, quote: str, timeframe: str = "15m"
+) -> AsyncIterator[List[List[Any]]]:
+    """Yield the full trading flow page by page, oldest candles first.
+
+    Unlike :func:`fetch_trading_flow`, only one exchange page is held in
+    memory at a time, so callers can stream candles straight to disk.
+    """
+
+    exchange = _get_exchange(exchange_id)
     (
-        exchange,
         symbol,
         timeframe_ms,
         limit,
         fetch_params,
-    ) = _prepare_exchange_market(exchange_id, base, quote, timeframe=timeframe)
+    ) = await _prepare_exchange_market(
+        exchange, exchange_id, base, quote, timeframe=timeframe
+    )
 
     try:
-        return _collect_full_ohlcv(
+        earliest_batch = await _find_earliest_batch(
+            exchange, symbol, timeframe, timeframe_ms, limit, fetch_params
+        )
+        if not earliest_batch:
+            return
+
+        last_ts = None
+        async for candles in _iter_ohlcv_pages(
             exchange,
             symbol,
             timeframe,
             timeframe_ms,
             limit,
             fetch_params,
-        )
+            earliest_batch[0][0],
+        ):
+            # Pages are ascending and may only overlap at their edges.
+            if last_ts is not None:
+                candles = [candle for candle in candles if candle[0] > last_ts]
+                if not candles:
+                    continue
+            last_ts = candles[-1][0]
+            yield candles
     except Exception as exc:  # pragma: no cover - network errors
         raise RuntimeError(
             f"Could not download full {timeframe} candle history: {exc}"
@@ -3,15 +3,36 @@ from __future__ import annotations
 
 import contextlib
 import io
+import queue
 import threading
 from pathlib import Path
 from tkinter import END, DISABLED, NORMAL, Tk, Text, filedialog, messagebox, ttk
+from typing import List
 
 from .cli import main as cli_main
 
 
 DEFAULT_OUTPUT = Path.home() / "Desktop" / "trading_flow_15m.csv"
 
+# How often (ms) the Tk loop pulls new CLI output, and how many chunks per tick.
+LOG_POLL_MS = 100
+LOG_CHUNKS_PER_TICK = 500
+
+
+class _QueueStream(io.TextIOBase):
+    """Text stream that hands every write to a queue for the Tk thread."""
+
+    def __init__(self, sink: "queue.Queue[str]") -> None:
+        super().__init__()
+        self._sink = sink
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._sink.put(text)
+        return len(text)
+
 
 def _append_log(widget: Text, text: str) -> None:
     widget.configure(state=NORMAL)
@@ -20,17 +41,28 @@ def _append_log(widget: Text, text: str) -> None:
     widget.configure(state=DISABLED)
 
 
-def _run_cli_async(symbol: str, output_csv: str, log_widget: Text, root: Tk) -> None:
+def _drain_log(root: Tk, log_widget: Text, log_queue: "queue.Queue[str]") -> None:
+    """Move pending CLI output into the log widget, then reschedule itself."""
+    chunks: List[str] = []
+    try:
+        while len(chunks) < LOG_CHUNKS_PER_TICK:
+            chunks.append(log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    if chunks:
+        _append_log(log_widget, "".join(chunks))
+    root.after(LOG_POLL_MS, _drain_log, root, log_widget, log_queue)
+
+
+def _run_cli_async(symbol: str, output_csv: str, log_queue: "queue.Queue[str]", root: Tk) -> None:
     def runner() -> None:
-        buf = io.StringIO()
+        stream = _QueueStream(log_queue)
         try:
-            with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
                 cli_main([symbol, "--output-csv", output_csv])
-            _append_log(log_widget, buf.getvalue())
             messagebox.showinfo("Complete", "Processing finished. Check the log output and CSV file.", parent=root)
         except Exception as exc:  # pragma: no cover - UI convenience
-            _append_log(log_widget, buf.getvalue())
-            _append_log(log_widget, f"\nERROR: {exc}\n")
+            log_queue.put(f"\nERROR: {exc}\n")
             messagebox.showerror("Failed", f"Run failed: {exc}", parent=root)
 
     threading.Thread(target=runner, daemon=True).start()
@@ -79,6 +111,8 @@ def main() -> None:
     # Log output
     log = Text(content, height=20, wrap="word", state=DISABLED)
     log.pack(fill="both", expand=True)
+    log_queue: "queue.Queue[str]" = queue.Queue()
+    _drain_log(root, log, log_queue)
 
     def on_run() -> None:
         symbol = symbol_var.get().strip()
@@ -91,7 +125,7 @@ def main() -> None:
             return
 
         _append_log(log, f"\nRunning: {symbol} -> {output_csv}\n")
-        _run_cli_async(symbol, output_csv, log, root)
+        _run_cli_async(symbol, output_csv, log_queue, root)
 
     actions = ttk.Frame(content)
     actions.pack(fill="x", pady=(10, 0))
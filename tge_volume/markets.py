@@ -0,0 +1,99 @@
+"""Build the list of centralized-exchange markets to query from CoinGecko tickers.
+
+This module is synchronous and free of ccxt so it can be compiled with mypyc
+(see ``setup.py``).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple, TypedDict
+
+from .utils import is_dex_name
+
+EXCHANGE_NAME_TO_CCXT_ID = {
+    "Binance": "binance",
+    "Binance US": "binanceus",
+    "OKX": "okx",
+    "OKX (Spot)": "okx",
+    "Bybit": "bybit",
+    "KuCoin": "kucoin",
+    "Gate": "gateio",
+    "Gate.io": "gateio",
+    "Gate (Spot)": "gateio",
+    "MEXC": "mexc",
+    "BitMart": "bitmart",
+    "Bitget": "bitget",
+    "Coinbase Exchange": "coinbase",
+    "Kraken": "kraken",
+    "Uniswap V2": "uniswap",
+    "Uniswap V3 (Ethereum)": "uniswap",
+    "PancakeSwap (v2)": "pancakeswap",
+    "BingX": "bingx",
+    "LBank": "lbank",
+}
+
+# Allow selectively disabling exchanges (e.g., for temporary outages) while
+# still showing them in the CLI output.
+DISABLED_EXCHANGES: Dict[str, str] = {}
+
+class Market(TypedDict):
+    """One centralized-exchange listing selected by :func:`build_markets`."""
+
+    exchange_name: str
+    base: str
+    quote: str
+    volume: float
+    ccxt_id: str | None
+    disabled_reason: str | None
+
+
+# is_dex_name results per market name; CoinGecko repeats the same exchange
+# name for every pair it lists there.
+_DEX_CACHE: Dict[str, bool] = {}
+
+
+def build_markets(tickers: List[Dict[str, Any]]) -> List[Market]:
+    """Return a deduplicated list of markets with volume metadata."""
+    # Best (volume, base, quote) seen per exchange name; dicts are built once
+    # for the survivors at the end.
+    best: Dict[str, Tuple[float, str, str]] = {}
+    dex_cache = _DEX_CACHE
+
+    for ticker in tickers:
+        market = ticker.get("market")
+        name = market and market.get("name")
+        if not name:
+            continue
+
+        dex = dex_cache.get(name)
+        if dex is None:
+            dex = dex_cache[name] = is_dex_name(name)
+        if dex:
+            # The CLI focuses on centralized exchanges only, so skip DEX entries
+            continue
+
+        base = ticker.get("base")
+        quote = ticker.get("target")
+        if not base or not quote:
+            continue
+
+        volume = ticker.get("volume") or 0
+        current = best.get(name)
+        if current is None or volume > current[0]:
+            best[name] = (volume, base, quote)
+
+    ccxt_ids = EXCHANGE_NAME_TO_CCXT_ID.get
+    disabled = DISABLED_EXCHANGES.get
+    markets: List[Market] = []
+    for name, (volume, base, quote) in best.items():
+        disabled_reason = disabled(name)
+        markets.append(
+            {
+                "exchange_name": name,
+                "base": base,
+                "quote": quote,
+                "volume": volume,
+                "ccxt_id": None if disabled_reason else ccxt_ids(name),
+                "disabled_reason": disabled_reason,
+            }
+        )
+    return markets
@@ -1,17 +1,47 @@
 """Shared helper utilities for the TGE analysis CLI."""
 from __future__ import annotations
 
+import json
+import os
+import re
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import quote
+
+json_loads: Callable[[bytes], Any]
+try:  # Optional C-accelerated decoder; same output as the stdlib parser.
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    json_loads = json.loads
+
+# Root directory for on-disk response caches; override with TGE_VOLUME_CACHE_DIR.
+CACHE_DIR = Path(
+    os.environ.get("TGE_VOLUME_CACHE_DIR") or Path.home() / ".cache" / "tge_volume"
+)
+
+
+# "swap" already covers Uniswap/SushiSwap/PancakeSwap; "pancake" catches
+# listings such as "Pancake v3" that omit the suffix.
+_DEX_RE = re.compile(r"swap|pancake", re.IGNORECASE)
 
 
 def is_dex_name(name: str) -> bool:
     """Return ``True`` when the given market name is a DEX."""
-    normalized = name.lower()
-    return any(term in normalized for term in ("swap", "uniswap", "pancake", "sushiswap"))
+    return _DEX_RE.search(name) is not None
 
 
+@lru_cache(maxsize=1 << 16)
 def ts_to_str(ts: int | None) -> str:
-    """Pretty-print a millisecond unix timestamp in UTC."""
+    """Pretty-print a millisecond unix timestamp in UTC.
+
+    Memoized because exchanges share the same 15m candle boundaries, so the
+    trading-flow export formats each timestamp once per exchange.
+    """
     if not ts:
         return "-"
     dt = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
@@ -27,3 +57,30 @@ def shorten_asset(symbol: str, *, head: int = 6, tail: int = 4, min_length: int
     prefix = symbol[:head]
     suffix = symbol[-tail:]
     return f"{prefix}...{suffix}"
+
+
+def cache_path(namespace: str, key: str) -> Path:
+    """Return the cache file used for ``key`` inside ``namespace``."""
+    return CACHE_DIR / namespace / f"{quote(key, safe='')}.json"
+
+
+def read_json_cache(path: Path, ttl: float) -> Any | None:
+    """Return the cached JSON payload, or ``None`` when missing or older than ``ttl`` seconds."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_cache(path: Path, payload: Any) -> None:
+    """Persist ``payload`` as JSON; cache failures never interrupt a run."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump(payload, fp)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        tmp_path.unlink(missing_ok=True)